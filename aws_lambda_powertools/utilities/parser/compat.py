@@ -1,4 +1,8 @@
 import functools
+from typing import TYPE_CHECKING, Any, Type, Union
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.parser.types import Model
 
 
 @functools.lru_cache(maxsize=None)
@@ -32,3 +36,33 @@ def disable_pydantic_v2_warning():
 
     except ImportError:
         pass
+
+
+def parse_model_obj(model: "Type[Model]", data: Any) -> "Model":
+    """
+    Validates a Python object against a Pydantic model.
+
+    Pydantic v2 models are validated with `model_validate` directly, so the validator already compiled
+    on the model is reused without going through the deprecated `parse_obj` shim and its warning machinery.
+    Pydantic v1 models, including `pydantic.v1` models under Pydantic v2, keep using `parse_obj`.
+    """
+    if callable(getattr(model, "model_validate", None)):
+        # Support for pydantic V2
+        return model.model_validate(data)  # type: ignore[unused-ignore,attr-defined]
+
+    return model.parse_obj(data)
+
+
+def parse_model_raw(model: "Type[Model]", data: Union[str, bytes, bytearray]) -> "Model":
+    """
+    Validates a JSON string or bytes against a Pydantic model.
+
+    For Pydantic v2 models, `model_validate_json` hands the payload straight to pydantic-core's JSON parser
+    instead of the deprecated `parse_raw` shim, which decodes it with `json` first.
+    Pydantic v1 models, including `pydantic.v1` models under Pydantic v2, keep using `parse_raw`.
+    """
+    if callable(getattr(model, "model_validate_json", None)):
+        # Support for pydantic V2
+        return model.model_validate_json(data)  # type: ignore[unused-ignore,attr-defined]
+
+    return model.parse_raw(data)  # type: ignore[arg-type, unused-ignore]
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, Optional, Type, Union
 
+from ..compat import parse_model_obj
 from ..models import APIGatewayProxyEventModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -27,6 +28,6 @@ class ApiGatewayEnvelope(BaseEnvelope):
             Parsed detail payload with model provided
         """
         logger.debug(f"Parsing incoming data with Api Gateway model {APIGatewayProxyEventModel}")
-        parsed_envelope: APIGatewayProxyEventModel = APIGatewayProxyEventModel.parse_obj(data)
+        parsed_envelope: APIGatewayProxyEventModel = parse_model_obj(model=APIGatewayProxyEventModel, data=data)
         logger.debug(f"Parsing event payload in `detail` with {model}")
         return self._parse(data=parsed_envelope.body, model=model)
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, Optional, Type, Union
 
+from ..compat import parse_model_obj
 from ..models import APIGatewayProxyEventV2Model
 from ..types import Model
 from .base import BaseEnvelope
@@ -27,6 +28,6 @@ class ApiGatewayV2Envelope(BaseEnvelope):
             Parsed detail payload with model provided
         """
         logger.debug(f"Parsing incoming data with Api Gateway model V2 {APIGatewayProxyEventV2Model}")
-        parsed_envelope: APIGatewayProxyEventV2Model = APIGatewayProxyEventV2Model.parse_obj(data)
+        parsed_envelope: APIGatewayProxyEventV2Model = parse_model_obj(model=APIGatewayProxyEventV2Model, data=data)
         logger.debug(f"Parsing event payload in `detail` with {model}")
         return self._parse(data=parsed_envelope.body, model=model)
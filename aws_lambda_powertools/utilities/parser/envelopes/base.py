@@ -2,7 +2,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Type, TypeVar, Union
 
-from aws_lambda_powertools.utilities.parser.compat import disable_pydantic_v2_warning
+from aws_lambda_powertools.utilities.parser.compat import parse_model_obj, parse_model_raw
 from aws_lambda_powertools.utilities.parser.types import Model
 
 logger = logging.getLogger(__name__)
@@ -27,18 +27,16 @@ class BaseEnvelope(ABC):
         Any
             Parsed data
         """
-        disable_pydantic_v2_warning()
-
         if data is None:
             logger.debug("Skipping parsing as event is None")
             return data
 
         logger.debug("parsing event against model")
-        if isinstance(data, str):
+        if isinstance(data, (str, bytes, bytearray)):
             logger.debug("parsing event as string")
-            return model.parse_raw(data)
+            return parse_model_raw(model=model, data=data)
 
-        return model.parse_obj(data)
+        return parse_model_obj(model=model, data=data)
 
     @abstractmethod
     def parse(self, data: Optional[Union[Dict[str, Any], Any]], model: Type[Model]):
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional, Type, Union
 
+from ..compat import parse_model_obj
 from ..models import CloudWatchLogsModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -34,7 +35,7 @@ class CloudWatchLogsEnvelope(BaseEnvelope):
             List of records parsed with model provided
         """
         logger.debug(f"Parsing incoming data with SNS model {CloudWatchLogsModel}")
-        parsed_envelope = CloudWatchLogsModel.parse_obj(data)
+        parsed_envelope = parse_model_obj(model=CloudWatchLogsModel, data=data)
         logger.debug(f"Parsing CloudWatch records in `body` with {model}")
         return [
             self._parse(data=record.message, model=model) for record in parsed_envelope.awslogs.decoded_data.logEvents
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional, Type, Union
 
+from ..compat import parse_model_obj
 from ..models import DynamoDBStreamModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -31,7 +32,7 @@ class DynamoDBStreamEnvelope(BaseEnvelope):
             List of dictionaries with NewImage and OldImage records parsed with model provided
         """
         logger.debug(f"Parsing incoming data with DynamoDB Stream model {DynamoDBStreamModel}")
-        parsed_envelope = DynamoDBStreamModel.parse_obj(data)
+        parsed_envelope = parse_model_obj(model=DynamoDBStreamModel, data=data)
         logger.debug(f"Parsing DynamoDB Stream new and old records with {model}")
         return [
             {
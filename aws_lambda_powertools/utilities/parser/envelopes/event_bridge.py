@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, Optional, Type, Union
 
+from ..compat import parse_model_obj
 from ..models import EventBridgeModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -27,6 +28,6 @@ class EventBridgeEnvelope(BaseEnvelope):
             Parsed detail payload with model provided
         """
         logger.debug(f"Parsing incoming data with EventBridge model {EventBridgeModel}")
-        parsed_envelope: EventBridgeModel = EventBridgeModel.parse_obj(data)
+        parsed_envelope: EventBridgeModel = parse_model_obj(model=EventBridgeModel, data=data)
         logger.debug(f"Parsing event payload in `detail` with {model}")
         return self._parse(data=parsed_envelope.detail, model=model)
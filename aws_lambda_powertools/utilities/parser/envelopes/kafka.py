@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional, Type, Union, cast
 
+from ..compat import parse_model_obj
 from ..models import KafkaMskEventModel, KafkaSelfManagedEventModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -38,7 +39,7 @@ class KafkaEnvelope(BaseEnvelope):
         )
 
         logger.debug(f"Parsing incoming data with Kafka event model {model_parse_event}")
-        parsed_envelope = model_parse_event.parse_obj(data)
+        parsed_envelope = parse_model_obj(model=model_parse_event, data=data)
         logger.debug(f"Parsing Kafka event records in `value` with {model}")
         ret_list = []
         for records in parsed_envelope.records.values():
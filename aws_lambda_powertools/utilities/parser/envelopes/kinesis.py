@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional, Type, Union, cast
 
+from ..compat import parse_model_obj
 from ..models import KinesisDataStreamModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -35,7 +36,7 @@ class KinesisDataStreamEnvelope(BaseEnvelope):
             List of records parsed with model provided
         """
         logger.debug(f"Parsing incoming data with Kinesis model {KinesisDataStreamModel}")
-        parsed_envelope: KinesisDataStreamModel = KinesisDataStreamModel.parse_obj(data)
+        parsed_envelope: KinesisDataStreamModel = parse_model_obj(model=KinesisDataStreamModel, data=data)
         logger.debug(f"Parsing Kinesis records in `body` with {model}")
         models = []
         for record in parsed_envelope.Records:
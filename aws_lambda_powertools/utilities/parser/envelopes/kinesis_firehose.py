@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional, Type, Union, cast
 
+from ..compat import parse_model_obj
 from ..models import KinesisFirehoseModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -37,7 +38,7 @@ class KinesisFirehoseEnvelope(BaseEnvelope):
             List of records parsed with model provided
         """
         logger.debug(f"Parsing incoming data with Kinesis Firehose model {KinesisFirehoseModel}")
-        parsed_envelope: KinesisFirehoseModel = KinesisFirehoseModel.parse_obj(data)
+        parsed_envelope: KinesisFirehoseModel = parse_model_obj(model=KinesisFirehoseModel, data=data)
         logger.debug(f"Parsing Kinesis Firehose records in `body` with {model}")
         models = []
         for record in parsed_envelope.records:
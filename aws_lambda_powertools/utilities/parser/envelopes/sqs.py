@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional, Type, Union
 
+from ..compat import parse_model_obj
 from ..models import SqsModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -34,6 +35,6 @@ class SqsEnvelope(BaseEnvelope):
             List of records parsed with model provided
         """
         logger.debug(f"Parsing incoming data with SQS model {SqsModel}")
-        parsed_envelope = SqsModel.parse_obj(data)
+        parsed_envelope = parse_model_obj(model=SqsModel, data=data)
         logger.debug(f"Parsing SQS records in `body` with {model}")
         return [self._parse(data=record.body, model=model) for record in parsed_envelope.Records]
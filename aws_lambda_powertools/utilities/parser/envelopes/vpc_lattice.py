@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, Optional, Type, Union
 
+from ..compat import parse_model_obj
 from ..models import VpcLatticeModel
 from ..types import Model
 from .base import BaseEnvelope
@@ -27,6 +28,6 @@ class VpcLatticeEnvelope(BaseEnvelope):
             Parsed detail payload with model provided
         """
         logger.debug(f"Parsing incoming data with VPC Lattice model {VpcLatticeModel}")
-        parsed_envelope: VpcLatticeModel = VpcLatticeModel.parse_obj(data)
+        parsed_envelope: VpcLatticeModel = parse_model_obj(model=VpcLatticeModel, data=data)
         logger.debug(f"Parsing event payload in `detail` with {model}")
         return self._parse(data=parsed_envelope.body, model=model)
@@ -1,25 +1,45 @@
+from __future__ import annotations
+
+import functools
+import inspect
 import logging
+import os
 from typing import Any, Callable, Dict, Optional, Type, overload
 
-from aws_lambda_powertools.utilities.parser.compat import disable_pydantic_v2_warning
+from aws_lambda_powertools.utilities.parser.compat import parse_model_obj, parse_model_raw
 from aws_lambda_powertools.utilities.parser.types import EventParserReturnType, Model
 
-from ...middleware_factory import lambda_handler_decorator
+from ...middleware_factory.exceptions import MiddlewareInvalidArgumentError
+from ...shared import constants
+from ...shared.functions import resolve_truthy_env_var_choice
+from ...tracing import Tracer
 from ..typing import LambdaContext
-from .envelopes.base import Envelope
+from .envelopes.base import BaseEnvelope, Envelope
 from .exceptions import InvalidEnvelopeError, InvalidModelTypeError
 
 logger = logging.getLogger(__name__)
 
 
-@lambda_handler_decorator
+@functools.lru_cache(maxsize=None)
+def _get_envelope(envelope: Type[Envelope]) -> Envelope:
+    """Returns a shared instance of the given envelope class
+
+    Envelopes are expected to be stateless, so we reuse a single instance per class instead of creating one per event.
+    This also applies to custom envelopes inheriting from BaseEnvelope, as documented.
+    Since only successful lookups are cached, the BaseEnvelope check below runs once per envelope class.
+    """
+    if not (isinstance(envelope, type) and issubclass(envelope, BaseEnvelope)):
+        raise InvalidEnvelopeError(f"Envelope must implement BaseEnvelope, envelope={envelope}")
+
+    return envelope()
+
+
 def event_parser(
-    handler: Callable[[Any, LambdaContext], EventParserReturnType],
-    event: Dict[str, Any],
-    context: LambdaContext,
+    handler: Optional[Callable[[Any, LambdaContext], EventParserReturnType]] = None,
+    *,
     model: Type[Model],
     envelope: Optional[Type[Envelope]] = None,
-) -> EventParserReturnType:
+) -> Callable:
     """Lambda handler decorator to parse & validate events using Pydantic models
 
     It requires a model that implements Pydantic BaseModel to parse & validate the event.
@@ -62,10 +82,6 @@ def event_parser(
     ----------
     handler:  Callable
         Method to annotate on
-    event:    Dict
-        Lambda event to be parsed & validated
-    context:  LambdaContext
-        Lambda context object
     model:   Model
         Your data model that will replace the event.
     envelope: Envelope
@@ -79,10 +95,42 @@ def event_parser(
         When model given does not implement BaseModel
     InvalidEnvelopeError
         When envelope given does not implement BaseEnvelope
+    MiddlewareInvalidArgumentError
+        When the decorated handler is not a function
     """
-    parsed_event = parse(event=event, model=model, envelope=envelope) if envelope else parse(event=event, model=model)
-    logger.debug(f"Calling handler {handler.__name__}")
-    return handler(parsed_event, context)
+    # The wrapper is hand-written rather than built with lambda_handler_decorator
+    # to avoid an extra frame and a functools.partial allocation on every invocation
+    if handler is None:
+        return functools.partial(event_parser, model=model, envelope=envelope)
+
+    if not inspect.isfunction(handler):
+        raise MiddlewareInvalidArgumentError(f"event_parser can only decorate functions, received {handler}")
+
+    handler_name = handler.__name__
+
+    @functools.wraps(handler)
+    def wrapper(event: Dict[str, Any], context: LambdaContext) -> EventParserReturnType:
+        try:
+            parsed_event = (
+                parse(event=event, model=model, envelope=envelope) if envelope else parse(event=event, model=model)
+            )
+            logger.debug("Calling handler %s", handler_name)
+            return handler(parsed_event, context)
+        except Exception:
+            logger.exception("Caught exception in event_parser")
+            raise
+
+    trace_execution = resolve_truthy_env_var_choice(env=os.getenv(constants.MIDDLEWARE_FACTORY_TRACE_ENV, "false"))
+    if not trace_execution:
+        return wrapper
+
+    @functools.wraps(handler)
+    def traced_wrapper(event: Dict[str, Any], context: LambdaContext) -> EventParserReturnType:
+        tracer = Tracer(auto_patch=False)
+        with tracer.provider.in_subsegment(name="## event_parser"):
+            return wrapper(event, context)
+
+    return traced_wrapper
 
 
 @overload
@@ -149,19 +197,16 @@ def parse(event: Dict[str, Any], model: Type[Model], envelope: Optional[Type[Env
     InvalidEnvelopeError
         When envelope given does not implement BaseEnvelope
     """
-    if envelope and callable(envelope):
-        try:
-            logger.debug(f"Parsing and validating event model with envelope={envelope}")
-            return envelope().parse(data=event, model=model)
-        except AttributeError:
-            raise InvalidEnvelopeError(f"Envelope must implement BaseEnvelope, envelope={envelope}")
-
-    try:
-        disable_pydantic_v2_warning()
-        logger.debug("Parsing and validating event model; no envelope used")
-        if isinstance(event, str):
-            return model.parse_raw(event)
-
-        return model.parse_obj(event)
-    except AttributeError:
+    # Duck-typed so pydantic.v1 models keep working when Pydantic v2 is installed
+    if not callable(getattr(model, "model_validate", None) or getattr(model, "parse_obj", None)):
         raise InvalidModelTypeError(f"Input model must implement BaseModel, model={model}")
+
+    if envelope and callable(envelope):
+        logger.debug("Parsing and validating event model with envelope=%s", envelope)
+        return _get_envelope(envelope).parse(data=event, model=model)
+
+    logger.debug("Parsing and validating event model; no envelope used")
+    if isinstance(event, (str, bytes, bytearray)):
+        return parse_model_raw(model=model, data=event)
+
+    return parse_model_obj(model=model, data=event)
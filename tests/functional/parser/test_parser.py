@@ -1,13 +1,18 @@
+import functools
 import json
-from typing import Dict, Union
+from typing import Any, Dict, Union
 
 import pydantic
 import pytest
 
+from aws_lambda_powertools.middleware_factory.exceptions import MiddlewareInvalidArgumentError
 from aws_lambda_powertools.utilities.parser import (
+    BaseEnvelope,
+    BaseModel,
     ValidationError,
     event_parser,
     exceptions,
+    parse,
 )
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
@@ -75,6 +80,23 @@ def test_pydanticv2_validation():
     assert event_parsed.version == int(event_raw["version"])
 
 
+@pytest.mark.usefixtures("pydanticv2_only")
+def test_parser_pydantic_v1_model_with_pydantic_v2_installed(dummy_event, dummy_envelope):
+    from pydantic import v1
+
+    # GIVEN a model using the pydantic.v1 compatibility layer shipped with Pydantic v2
+    class MyDummyV1Model(v1.BaseModel):
+        message: str
+
+    # WHEN parsing the event with and without an envelope
+    parsed_event = parse(event=dummy_event["payload"], model=MyDummyV1Model)
+    parsed_enveloped_event = parse(event=dummy_event, model=MyDummyV1Model, envelope=dummy_envelope)
+
+    # THEN the model is parsed as expected
+    assert parsed_event.message == "hello world"
+    assert parsed_enveloped_event.message == "hello world"
+
+
 @pytest.mark.parametrize("invalid_schema", [None, str, bool(), [], (), object])
 def test_parser_with_invalid_schema_type(dummy_event, invalid_schema):
     @event_parser(model=invalid_schema)
@@ -85,6 +107,16 @@ def test_parser_with_invalid_schema_type(dummy_event, invalid_schema):
         handle_no_envelope(event=dummy_event, context=LambdaContext())
 
 
+@pytest.mark.parametrize("invalid_schema", [None, str, bool(), [], (), object])
+def test_parser_with_invalid_schema_type_and_envelope(dummy_event, dummy_envelope, invalid_schema):
+    @event_parser(model=invalid_schema, envelope=dummy_envelope)
+    def handle_with_envelope(event: Dict, _: LambdaContext):
+        return event
+
+    with pytest.raises(exceptions.InvalidModelTypeError):
+        handle_with_envelope(event=dummy_event, context=LambdaContext())
+
+
 def test_parser_event_as_json_string(dummy_event, dummy_schema):
     dummy_event = json.dumps(dummy_event["payload"])
 
@@ -93,3 +125,96 @@ def test_parser_event_as_json_string(dummy_event, dummy_schema):
         return event
 
     handle_no_envelope(dummy_event, LambdaContext())
+
+
+def test_parser_event_as_json_bytes(dummy_event, dummy_schema):
+    dummy_event = json.dumps(dummy_event["payload"]).encode()
+
+    @event_parser(model=dummy_schema)
+    def handle_no_envelope(event: Union[Dict, bytes], _: LambdaContext):
+        return event
+
+    assert handle_no_envelope(dummy_event, LambdaContext()).message == "hello world"
+
+
+def test_parser_envelope_instance_is_reused(dummy_event, dummy_schema, dummy_envelope_schema):
+    # GIVEN an envelope that counts how many times it was instantiated
+    instances = []
+
+    class CountingEnvelope(BaseEnvelope):
+        def __init__(self):
+            instances.append(self)
+
+        def parse(self, data: Dict[str, Any], model: BaseModel):
+            parsed_enveloped = dummy_envelope_schema(**data)
+            return self._parse(data=parsed_enveloped.payload, model=model)
+
+    @event_parser(model=dummy_schema, envelope=CountingEnvelope)
+    def handle_with_envelope(event: Dict, _: LambdaContext):
+        return event
+
+    # WHEN parsing multiple events
+    handle_with_envelope(dummy_event, LambdaContext())
+    handle_with_envelope(dummy_event, LambdaContext())
+
+    # THEN the envelope is only instantiated once
+    assert len(instances) == 1
+
+
+def test_parser_decorator_called_directly_with_handler(dummy_event, dummy_schema):
+    # GIVEN a handler decorated by calling event_parser with the handler directly
+    def handler(event, _: LambdaContext):
+        return event
+
+    wrapped = event_parser(handler, model=dummy_schema)
+
+    # WHEN invoking the wrapped handler
+    parsed_event = wrapped(dummy_event["payload"], LambdaContext())
+
+    # THEN the event is parsed and the handler metadata is preserved
+    assert parsed_event.message == "hello world"
+    assert wrapped.__name__ == "handler"
+
+
+def test_parser_decorator_rejects_non_function_handler(dummy_schema):
+    # GIVEN a handler that is not a plain function
+    def handler(event, _: LambdaContext, extra=None):
+        return event
+
+    # WHEN decorating it with event_parser
+    # THEN it fails at decoration time rather than on every invocation
+    with pytest.raises(MiddlewareInvalidArgumentError):
+        event_parser(functools.partial(handler, extra=2), model=dummy_schema)
+
+
+def test_parser_tracing_env_var(monkeypatch, mocker, dummy_event, dummy_schema):
+    # GIVEN middleware tracing is enabled via environment variable
+    monkeypatch.setenv("POWERTOOLS_TRACE_MIDDLEWARES", "true")
+    monkeypatch.setenv("POWERTOOLS_TRACE_DISABLED", "true")
+    tracer = mocker.patch("aws_lambda_powertools.utilities.parser.parser.Tracer")
+
+    @event_parser(model=dummy_schema)
+    def handler(event, _: LambdaContext):
+        return event
+
+    # WHEN invoking the decorated handler
+    parsed_event = handler(dummy_event["payload"], LambdaContext())
+
+    # THEN event_parser runs within its own subsegment
+    assert parsed_event.message == "hello world"
+    tracer.return_value.provider.in_subsegment.assert_called_once_with(name="## event_parser")
+
+
+def test_parser_tracing_disabled_by_default(mocker, dummy_event, dummy_schema):
+    # GIVEN middleware tracing is not enabled
+    tracer = mocker.patch("aws_lambda_powertools.utilities.parser.parser.Tracer")
+
+    @event_parser(model=dummy_schema)
+    def handler(event, _: LambdaContext):
+        return event
+
+    # WHEN invoking the decorated handler
+    handler(dummy_event["payload"], LambdaContext())
+
+    # THEN no subsegment is created
+    tracer.assert_not_called()